@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import argparse
+import queue
 from src.config_manager import ConfigManager
 from src.backup_manager import BackupManager
 from src.scheduler import BackupScheduler, SimpleScheduler
@@ -10,13 +13,26 @@ def setup_logging(logging_config):
     log_file = logging_config.get('log_file', './logs/network_backup.log')
     log_level = getattr(logging, logging_config.get('level', 'INFO').upper(), logging.INFO)
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    logging.basicConfig(
-        filename=log_file,
-        level=log_level,
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    logging.getLogger().addHandler(logging.StreamHandler())
+    ))
+    stream_handler = logging.StreamHandler()
+
+    # Loggers only enqueue records; a background thread does the file and
+    # console I/O so logging never blocks the backup event loop
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(log_level)
+
+    listener.start()
+    atexit.register(listener.stop)
 
 def main():
     parser = argparse.ArgumentParser(description="Network Device Backup Tool")
@@ -32,12 +48,17 @@ def main():
     logger = logging.getLogger('main')
 
     backup_manager = BackupManager(config_manager)
+    atexit.register(backup_manager.device_manager.close_all)
     email_notifier = EmailNotifier(settings['email'])
 
     def backup_and_notify():
         success, fail, errors = backup_manager.run_backup()
         email_notifier.send_backup_report(success, fail, errors)
 
+    async def backup_and_notify_async():
+        success, fail, errors = await backup_manager.run_backup_async()
+        await email_notifier.send_backup_report_async(success, fail, errors)
+
     if args.backup:
         logger.info("Running one-time backup...")
         backup_and_notify()
@@ -46,7 +67,7 @@ def main():
         try:
             # Prefer APScheduler, fallback to schedule
             try:
-                scheduler = BackupScheduler(config_manager, backup_and_notify)
+                scheduler = BackupScheduler(config_manager, backup_and_notify_async, backup_manager.device_manager)
                 scheduler.start_scheduler()
             except ImportError:
                 logger.warning("APScheduler not available, using simple scheduler.")
@@ -4,19 +4,128 @@ Backup Manager for Network Device Backup Tool
 Handles the backup process, file management, and cleanup operations.
 """
 
+import asyncio
+import io
+import json
 import os
 import logging
+import logging.handlers
+import multiprocessing
+import re
 import shutil
+import tarfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+import zstandard as zstd
 from .device_manager import DeviceManager
 from .config_manager import ConfigManager
 
+# Buffer size for backup file writes; the 8 KiB default splits large configs
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Separator between the backup header and the device configuration
+HEADER_RULE = "#" + "=" * 70 + "\n\n"
+
+# Backups are written zstd-compressed; plain .txt files from older
+# versions are still listed and cleaned up
+BACKUP_SUFFIX = '.txt.zst'
+ZSTD_LEVEL = 7
+
+# With archive_per_run enabled, each run is one <YYYYMMDD_HHMMSS>.tar.zst
+# holding a <device>.txt member per device
+ARCHIVE_SUFFIX = '.tar.zst'
+
+BACKUP_SUFFIXES = ('.txt', '.txt.zst', ARCHIVE_SUFFIX)
+
+# Backups are written to <name>.tmp and renamed into place; a crash or power
+# loss mid-write leaves the temp file behind for cleanup to remove
+TEMP_SUFFIXES = tuple(suffix + '.tmp' for suffix in BACKUP_SUFFIXES)
+
+# Devices configured with this type are probed with SSHDetect; the detected
+# type is remembered per IP in DEVICE_TYPES_FILE inside the backup directory
+AUTODETECT = 'autodetect'
+DEVICE_TYPES_FILE = '.device_types.json'
+
+
+class _ForwardToLoggers(logging.Handler):
+    """Re-emits log records from backup worker processes through this process's loggers."""
+
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+
+class _RunArchive:
+    """Streams one backup run into a single zstd-compressed tar archive."""
+
+    def __init__(self, path: Path, mtime: float):
+        """
+        Open the archive under a temporary name.
+
+        Args:
+            path: Final archive path
+            mtime: Modification time recorded for every member (the run's time)
+        """
+        self.path = path
+        self.mtime = mtime
+        self.temp_path = path.with_name(path.name + '.tmp')
+        self.member_count = 0
+        self._lock = threading.Lock()
+
+        self._raw = open(self.temp_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        try:
+            # closefd=False keeps the file open so close() can fsync it
+            self._writer = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(
+                self._raw, closefd=False
+            )
+            self._tar = tarfile.open(fileobj=self._writer, mode='w|')
+        except Exception:
+            self._raw.close()
+            self.temp_path.unlink()
+            raise
+
+    def add(self, name: str, payload: str):
+        """Append a text member; safe to call from several backup threads."""
+        data = payload.encode('utf-8')
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+
+        with self._lock:
+            self._tar.addfile(info, io.BytesIO(data))
+            self.member_count += 1
+
+    def close(self):
+        """Finish the archive and move it into place, or discard it if empty."""
+        try:
+            try:
+                self._tar.close()
+                self._writer.close()
+                self._raw.flush()
+                os.fsync(self._raw.fileno())
+            finally:
+                self._raw.close()
+
+            if self.member_count:
+                os.replace(self.temp_path, self.path)
+            else:
+                self.temp_path.unlink()
+        except Exception:
+            # An unfinished temp archive would never be matched by cleanup
+            self.temp_path.unlink(missing_ok=True)
+            raise
+
 
 class BackupManager:
     """Manages network device backup operations."""
 
+    # Backup file names: <device>_<YYYYMMDD>_<HHMMSS>.txt[.zst]
+    _NAME_RE = re.compile(r'^(?P<device>.+)_(?P<ts>\d{8}_\d{6})\.txt(?:\.zst)?$')
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize BackupManager.
@@ -25,21 +134,41 @@ class BackupManager:
             config_manager: ConfigManager instance
         """
         self.config_manager = config_manager
-        self.device_manager = DeviceManager()
+
+        ssh_config = self.config_manager.get_ssh_config()
+        self.device_manager = DeviceManager(
+            ssh_config_path=ssh_config['ssh_config_file'] or None,
+            fast_cli=ssh_config['fast_cli'],
+            global_delay_factor=ssh_config['global_delay_factor']
+        )
         self.logger = logging.getLogger(__name__)
 
         # Create backup directory if it doesn't exist
         self.backup_dir = Path(self.config_manager.get_backup_directory())
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+        # Last working device type per IP for autodetected devices
+        self.device_types_file = self.backup_dir / DEVICE_TYPES_FILE
+        self._last_good = self._load_device_types()
+
     def run_backup(self) -> Tuple[int, int, List[str]]:
         """
         Run backup for all configured devices.
 
+        Returns:
+            Tuple of (successful_backups, failed_backups, error_messages)
+        """
+        return asyncio.run(self.run_backup_async())
+
+    async def run_backup_async(self) -> Tuple[int, int, List[str]]:
+        """
+        Run backup for all configured devices on the running event loop.
+
         Returns:
             Tuple of (successful_backups, failed_backups, error_messages)
         """
         self.logger.info("Starting backup process")
+        loop = asyncio.get_running_loop()
 
         # Load device configurations
         try:
@@ -54,86 +183,427 @@ class BackupManager:
             self.logger.warning(error_msg)
             return 0, 0, [error_msg]
 
+        # Read the clock once; every file in this run shares the timestamp
+        backup_time = datetime.now()
+
+        # Resolve each device hostname once per run, picking up DNS changes
+        self.device_manager.clear_dns_cache()
+
+        # Backup devices concurrently, optionally sharded across worker processes;
+        # a per-run archive is a single stream, so it is always written in-process
+        # Each worker needs at least one of the max_concurrency connection slots
+        worker_processes = min(self.config_manager.get_worker_processes(), len(devices),
+                               self.config_manager.get_max_concurrency())
+        if worker_processes > 1 and not self.config_manager.get_archive_per_run():
+            successful_backups, failed_backups, error_messages = await loop.run_in_executor(
+                None, self._run_sharded, devices, backup_time, worker_processes
+            )
+        else:
+            successful_backups, failed_backups, error_messages = await self._gather_backups(
+                devices, backup_time
+            )
+
+        # Directory fsync and cleanup touch the filesystem; keep them off the loop
+        error_messages.extend(await loop.run_in_executor(None, self._finish_backup))
+
+        self.logger.info("Backup process completed: %s successful, %s failed", successful_backups, failed_backups)
+
+        return successful_backups, failed_backups, error_messages
+
+    def _finish_backup(self) -> List[str]:
+        """
+        Persist this run's results and clean up old backups.
+
+        Returns:
+            List of error messages
+        """
+        error_messages = []
+
+        # Persist all renamed backup files with a single directory fsync
+        self._sync_backup_dir()
+        self._save_device_types()
+
+        # Clean up old backups
+        try:
+            self.cleanup_old_backups()
+        except Exception as e:
+            error_msg = f"Error during backup cleanup: {str(e)}"
+            self.logger.error(error_msg)
+            error_messages.append(error_msg)
+
+        return error_messages
+
+    def _run_sharded(self, devices: List[Dict], backup_time: datetime, processes: int) -> Tuple[int, int, List[str]]:
+        """
+        Split devices across worker processes, each running its own event loop.
+
+        Args:
+            devices: List of device configuration dictionaries
+            backup_time: Time of this backup run
+            processes: Number of worker processes
+
+        Returns:
+            Tuple of (successful_backups, failed_backups, error_messages)
+        """
+        chunks = [devices[i::processes] for i in range(processes)]
+
+        # Split max_concurrency between the workers so the run as a whole
+        # never holds more sessions than the setting allows
+        share, extra = divmod(self.config_manager.get_max_concurrency(), processes)
+        concurrency = [share + (1 if i < extra else 0) for i in range(processes)]
+        config_dir = str(self.config_manager.config_dir)
+
         successful_backups = 0
         failed_backups = 0
         error_messages = []
 
-        # Get current timestamp for backup files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")        # Backup each device
-        for device in devices:
-            device_name = device.get('name', device.get('ip', 'unknown'))
+        self.logger.info("Backing up %s devices across %s worker processes", len(devices), processes)
 
-            try:
-                self.logger.info(f"Backing up {device_name}")
+        # Spawn workers on every platform rather than fork a process that
+        # already runs logging, executor and paramiko threads; workers send
+        # their log records back here over a queue
+        mp_context = multiprocessing.get_context('spawn')
+        log_queue = mp_context.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, _ForwardToLoggers())
+        log_listener.start()
 
-                # Get device configuration
-                success, config, error_msg = self.device_manager.get_device_config(device)
+        try:
+            with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context,
+                                     initializer=_init_worker,
+                                     initargs=(log_queue, logging.getLogger().getEffectiveLevel())) as executor:
+                futures = {
+                    executor.submit(_run_chunk, config_dir, chunk, backup_time, max_concurrency): chunk
+                    for chunk, max_concurrency in zip(chunks, concurrency)
+                }
 
-                if success and config:
-                    # Save configuration to file
-                    backup_filename = f"{device_name}_{timestamp}.txt"
-                    backup_filepath = self.backup_dir / backup_filename
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        success, fail, errors, device_types = future.result()
+                    except Exception as e:
+                        error_msg = f"Backup worker failed for {len(chunk)} devices: {str(e)}"
+                        self.logger.error(error_msg)
+                        success, fail, errors, device_types = 0, len(chunk), [error_msg], None
+
+                    # Merge device types the worker detected or forgot for its devices
+                    if device_types is not None:
+                        for device in chunk:
+                            if device['ip'] in device_types:
+                                self._last_good[device['ip']] = device_types[device['ip']]
+                            else:
+                                self._last_good.pop(device['ip'], None)
+
+                    successful_backups += success
+                    failed_backups += fail
+                    error_messages.extend(errors)
+        finally:
+            log_listener.stop()
 
-                    with open(backup_filepath, 'w', encoding='utf-8') as backup_file:
-                        backup_file.write(f"# Configuration backup for {device_name}\n")
-                        backup_file.write(f"# Backup date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        backup_file.write(f"# Device IP: {device['ip']}\n")
-                        backup_file.write(f"# Device Type: {device['device_type']}\n")
-                        backup_file.write("#" + "="*70 + "\n\n")
-                        backup_file.write(config)
+        return successful_backups, failed_backups, error_messages
 
-                    self.logger.info(f"Successfully backed up {device_name} to {backup_filename}")
-                    successful_backups += 1
+    async def _gather_backups(self, devices: List[Dict], backup_time: datetime,
+                              max_concurrency: Optional[int] = None) -> Tuple[int, int, List[str]]:
+        """
+        Back up all devices concurrently, bounded by the max_concurrency setting.
 
-                else:
-                    error_msg = error_msg or f"Failed to retrieve configuration from {device_name}"
-                    self.logger.error(error_msg)
-                    error_messages.append(error_msg)
-                    failed_backups += 1
+        Args:
+            devices: List of device configuration dictionaries
+            backup_time: Time of this backup run
+            max_concurrency: Concurrent backups allowed here (default: the
+                max_concurrency setting); a sharded worker gets its share
+
+        Returns:
+            Tuple of (successful_backups, failed_backups, error_messages)
+        """
+        timestamp = backup_time.strftime("%Y%m%d_%H%M%S")
+        header_date = backup_time.strftime('%Y-%m-%d %H:%M:%S')
 
+        archive = None
+        if self.config_manager.get_archive_per_run():
+            try:
+                archive = _RunArchive(self.backup_dir / f"{timestamp}{ARCHIVE_SUFFIX}", backup_time.timestamp())
             except Exception as e:
-                error_msg = f"Unexpected error backing up {device_name}: {str(e)}"
+                error_msg = f"Error creating backup archive: {str(e)}"
                 self.logger.error(error_msg)
+                return 0, len(devices), [error_msg]
+
+        max_concurrency = max_concurrency or self.config_manager.get_max_concurrency()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                results = await asyncio.gather(
+                    *(self._backup_one(device, timestamp, header_date, semaphore, executor, archive)
+                      for device in devices),
+                    return_exceptions=True
+                )
+        finally:
+            archive_error = None
+            if archive is not None:
+                try:
+                    archive.close()
+                except Exception as e:
+                    archive_error = f"Error writing backup archive {archive.path.name}: {str(e)}"
+                    self.logger.error(archive_error)
+
+        successful_backups = 0
+        failed_backups = 0
+        error_messages = []
+
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                device_name = device.get('name', device.get('ip', 'unknown'))
+                error_msg = f"Unexpected error backing up {device_name}: {str(result)}"
+                self.logger.error(error_msg)
+                result = (False, error_msg)
+
+            success, error_msg = result
+            if success:
+                successful_backups += 1
+            else:
                 error_messages.append(error_msg)
                 failed_backups += 1
 
-        # Clean up old backups
+        # A broken archive loses every device written into it
+        if archive_error:
+            failed_backups += successful_backups
+            successful_backups = 0
+            error_messages.append(archive_error)
+
+        return successful_backups, failed_backups, error_messages
+
+    async def _backup_one(self, device: Dict, timestamp: str, header_date: str,
+                          semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor,
+                          archive: Optional[_RunArchive] = None) -> Tuple[bool, str]:
+        """
+        Back up a single device without blocking the event loop.
+
+        The blocking SSH session and file write run in the executor.
+
+        Returns:
+            Tuple of (success_status, error_message)
+        """
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor, self._backup_device, device, timestamp, header_date, archive
+            )
+
+    def _backup_device(self, device: Dict, timestamp: str, header_date: str,
+                       archive: Optional[_RunArchive] = None) -> Tuple[bool, str]:
+        """
+        Retrieve a device configuration and save it to a backup file.
+
+        Args:
+            device: Device configuration dictionary
+            timestamp: Timestamp used in the backup file name
+            header_date: Backup date written in the file header
+            archive: Per-run archive to add the backup to instead of a file
+
+        Returns:
+            Tuple of (success_status, error_message)
+        """
+        device_name = device.get('name', device.get('ip', 'unknown'))
+
         try:
-            self.cleanup_old_backups()
+            self.logger.info("Backing up %s", device_name)
+
+            # Get device configuration
+            success, config, error_msg = self._get_device_config(device)
+
+            if success and config:
+                payload = self._format_backup(device_name, device, header_date, config)
+
+                if archive is not None:
+                    archive.add(f"{device_name}.txt", payload)
+                    self.logger.info("Successfully backed up %s to %s", device_name, archive.path.name)
+                    return True, ""
+
+                # Save configuration to a zstd-compressed file
+                backup_filename = f"{device_name}_{timestamp}{BACKUP_SUFFIX}"
+                backup_filepath = self.backup_dir / backup_filename
+
+                # ZstdCompressor is not thread-safe, so each backup gets its own
+                compressed = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(payload.encode('utf-8'))
+
+                # Write and fsync a temp file, then rename it into place so a crash
+                # never leaves a truncated backup; the directory is fsynced once per run
+                temp_filepath = backup_filepath.with_name(backup_filename + '.tmp')
+                try:
+                    with open(temp_filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as backup_file:
+                        backup_file.write(compressed)
+                        backup_file.flush()
+                        os.fsync(backup_file.fileno())
+                    os.replace(temp_filepath, backup_filepath)
+                except Exception:
+                    if temp_filepath.exists():
+                        temp_filepath.unlink()
+                    raise
+
+                self.logger.info("Successfully backed up %s to %s", device_name, backup_filename)
+                return True, ""
+
+            error_msg = error_msg or f"Failed to retrieve configuration from {device_name}"
+            self.logger.error(error_msg)
+            return False, error_msg
+
         except Exception as e:
-            error_msg = f"Error during backup cleanup: {str(e)}"
+            error_msg = f"Unexpected error backing up {device_name}: {str(e)}"
             self.logger.error(error_msg)
-            error_messages.append(error_msg)
+            return False, error_msg
+
+    @staticmethod
+    def _format_backup(device_name: str, device: Dict, header_date: str, config: str) -> str:
+        """Build the backup file contents: a comment header followed by the configuration."""
+        return ''.join((
+            f"# Configuration backup for {device_name}\n",
+            f"# Backup date: {header_date}\n",
+            f"# Device IP: {device['ip']}\n",
+            f"# Device Type: {device['device_type']}\n",
+            HEADER_RULE,
+            config
+        ))
+
+    def _get_device_config(self, device: Dict) -> Tuple[bool, str, str]:
+        """
+        Retrieve a device configuration, resolving 'autodetect' device types.
 
-        self.logger.info(f"Backup process completed: {successful_backups} successful, {failed_backups} failed")
+        A detected type is remembered per IP and tried first on later runs,
+        so SSHDetect only probes the device again once that type stops working.
 
-        return successful_backups, failed_backups, error_messages
+        Args:
+            device: Device configuration dictionary
+
+        Returns:
+            Tuple of (success_status, configuration_text, error_message)
+        """
+        if device['device_type'] != AUTODETECT:
+            return self.device_manager.get_device_config(device)
+
+        ip = device['ip']
+        remembered = self._last_good.get(ip)
+        if remembered:
+            success, config, error_msg = self.device_manager.get_device_config(dict(device, device_type=remembered))
+            if success and config:
+                return success, config, error_msg
+
+            self.logger.warning("Remembered device type %s failed for %s, detecting again", remembered, ip)
+            self._last_good.pop(ip, None)
+
+        device_type = self.device_manager.detect_device_type(device)
+        if not device_type:
+            device_name = device.get('name', ip)
+            return False, "", f"Could not detect device type of {device_name}"
+
+        success, config, error_msg = self.device_manager.get_device_config(dict(device, device_type=device_type))
+        if success and config:
+            self._last_good[ip] = device_type
+
+        return success, config, error_msg
+
+    def _load_device_types(self) -> Dict[str, str]:
+        """Load remembered device types from the backup directory."""
+        try:
+            with open(self.device_types_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable %s: %s", self.device_types_file, e)
+            return {}
+
+    def _save_device_types(self):
+        """Persist remembered device types if they changed since the last save."""
+        if self._last_good == self._load_device_types():
+            return
+
+        temp_file = self.device_types_file.with_name(DEVICE_TYPES_FILE + '.tmp')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as file:
+                json.dump(self._last_good, file, indent=2, sort_keys=True)
+            os.replace(temp_file, self.device_types_file)
+        except OSError as e:
+            self.logger.warning("Could not save %s: %s", self.device_types_file, e)
+
+    def _sync_backup_dir(self):
+        """Flush directory entries for this run's backups to disk."""
+        try:
+            dir_fd = os.open(self.backup_dir, os.O_RDONLY)
+        except OSError as e:
+            # Directories cannot be opened for fsync on Windows
+            self.logger.debug("Skipping backup directory fsync: %s", e)
+            return
+
+        try:
+            os.fsync(dir_fd)
+        except OSError as e:
+            self.logger.warning("Could not fsync backup directory: %s", e)
+        finally:
+            os.close(dir_fd)
+
+    @classmethod
+    def _device_from_filename(cls, filename: str) -> Optional[str]:
+        """
+        Extract the device name from a backup file name, allowing underscores in it.
+
+        Returns None for per-run archives, which hold backups of many devices.
+        """
+        if filename.endswith(ARCHIVE_SUFFIX):
+            return None
+        match = cls._NAME_RE.match(filename)
+        return match['device'] if match else filename.partition('_')[0]
+
+    def _scan_backup_files(self, suffixes: Tuple[str, ...] = BACKUP_SUFFIXES):
+        """
+        Yield backup files in the backup directory.
+
+        Uses a single os.scandir pass; DirEntry caches its stat result, so
+        callers never stat a file twice.
+
+        Args:
+            suffixes: File name endings to match
+
+        Yields:
+            Tuples of (os.DirEntry, os.stat_result)
+        """
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes) and entry.is_file():
+                    yield entry, entry.stat()
 
     def cleanup_old_backups(self):
-        """Remove backup files older than the configured retention period."""
+        """
+        Remove backup files older than the configured retention period.
+
+        Temp files left behind by interrupted writes are removed on the same
+        cutoff, so a write still in progress is never touched.
+        """
         retention_days = self.config_manager.get_retention_days()
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        cutoff_ts = (datetime.now() - timedelta(days=retention_days)).timestamp()
 
-        self.logger.info(f"Cleaning up backups older than {retention_days} days")
+        self.logger.info("Cleaning up backups older than %s days", retention_days)
 
         deleted_count = 0
 
         try:
-            for backup_file in self.backup_dir.glob("*.txt"):
-                file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-
-                if file_mtime < cutoff_date:
-                    self.logger.info(f"Deleting old backup: {backup_file.name}")
-                    backup_file.unlink()
+            for entry, file_stat in self._scan_backup_files():
+                if file_stat.st_mtime < cutoff_ts:
+                    self.logger.info("Deleting old backup: %s", entry.name)
+                    os.unlink(entry.path)
                     deleted_count += 1
 
+            for entry, file_stat in self._scan_backup_files(TEMP_SUFFIXES):
+                if file_stat.st_mtime < cutoff_ts:
+                    self.logger.info("Deleting stale temp file: %s", entry.name)
+                    os.unlink(entry.path)
+
             if deleted_count > 0:
-                self.logger.info(f"Deleted {deleted_count} old backup files")
+                self.logger.info("Deleted %s old backup files", deleted_count)
             else:
                 self.logger.info("No old backup files to delete")
 
         except Exception as e:
-            self.logger.error(f"Error during backup cleanup: {str(e)}")
+            self.logger.error("Error during backup cleanup: %s", e)
             raise
 
     def get_backup_statistics(self) -> Dict:
@@ -145,6 +615,7 @@ class BackupManager:
         """
         stats = {
             'total_backups': 0,
+            'archives': 0,
             'devices': {},
             'oldest_backup': None,
             'newest_backup': None,
@@ -152,40 +623,40 @@ class BackupManager:
         }
 
         try:
-            backup_files = list(self.backup_dir.glob("*.txt"))
-            stats['total_backups'] = len(backup_files)
+            total_size = 0
+            devices = defaultdict(int)
+            min_mtime = float('inf')
+            max_mtime = float('-inf')
 
-            if backup_files:
-                total_size = 0
-                oldest_time = None
-                newest_time = None
+            for entry, file_stat in self._scan_backup_files():
+                stats['total_backups'] += 1
 
-                for backup_file in backup_files:
-                    # Get file size
-                    file_size = backup_file.stat().st_size
-                    total_size += file_size
+                # Get file size
+                total_size += file_stat.st_size
 
-                    # Get file modification time
-                    file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
+                # Track oldest/newest by raw modification time
+                file_mtime = file_stat.st_mtime
 
-                    if oldest_time is None or file_mtime < oldest_time:
-                        oldest_time = file_mtime
-                        stats['oldest_backup'] = backup_file.name
+                if file_mtime < min_mtime:
+                    min_mtime = file_mtime
+                    stats['oldest_backup'] = entry.name
 
-                    if newest_time is None or file_mtime > newest_time:
-                        newest_time = file_mtime
-                        stats['newest_backup'] = backup_file.name
+                if file_mtime > max_mtime:
+                    max_mtime = file_mtime
+                    stats['newest_backup'] = entry.name
 
-                    # Count backups per device
-                    device_name = backup_file.name.split('_')[0]
-                    if device_name not in stats['devices']:
-                        stats['devices'][device_name] = 0
-                    stats['devices'][device_name] += 1
+                # Count backups per device; per-run archives are counted separately
+                device = self._device_from_filename(entry.name)
+                if device is None:
+                    stats['archives'] += 1
+                else:
+                    devices[device] += 1
 
-                stats['total_size_mb'] = round(total_size / (1024 * 1024), 2)
+            stats['devices'] = dict(devices)
+            stats['total_size_mb'] = round(total_size / (1024 * 1024), 2)
 
         except Exception as e:
-            self.logger.error(f"Error getting backup statistics: {str(e)}")
+            self.logger.error("Error getting backup statistics: %s", e)
 
         return stats
 
@@ -200,7 +671,7 @@ class BackupManager:
             devices = self.config_manager.load_devices_config()
             return self.device_manager.test_all_devices(devices)
         except Exception as e:
-            self.logger.error(f"Error testing devices: {str(e)}")
+            self.logger.error("Error testing devices: %s", e)
             return [("error", False, f"Error loading device configuration: {str(e)}")]
 
     def list_backup_files(self) -> List[Dict]:
@@ -213,20 +684,58 @@ class BackupManager:
         backup_files = []
 
         try:
-            for backup_file in sorted(self.backup_dir.glob("*.txt"), key=lambda x: x.stat().st_mtime, reverse=True):
-                file_stat = backup_file.stat()
+            scanned = sorted(
+                ((file_stat.st_mtime, entry.name, file_stat) for entry, file_stat in self._scan_backup_files()),
+                reverse=True
+            )
+
+            # Work on raw timestamps; no datetime objects per file
+            now_ts = time.time()
 
+            for mtime, filename, file_stat in scanned:
+                device = self._device_from_filename(filename)
                 backup_info = {
-                    'filename': backup_file.name,
-                    'device': backup_file.name.split('_')[0],
-                    'timestamp': datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                    'filename': filename,
+                    'kind': 'file' if device else 'archive',
+                    'device': device,
+                    'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime)),
                     'size_kb': round(file_stat.st_size / 1024, 2),
-                    'age_days': (datetime.now() - datetime.fromtimestamp(file_stat.st_mtime)).days
+                    'age_days': int((now_ts - mtime) // 86400)
                 }
 
                 backup_files.append(backup_info)
 
         except Exception as e:
-            self.logger.error(f"Error listing backup files: {str(e)}")
+            self.logger.error("Error listing backup files: %s", e)
 
         return backup_files
+
+
+def _init_worker(log_queue, log_level: int):
+    """Route a backup worker's log records to the parent process."""
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+
+def _run_chunk(config_dir: str, devices: List[Dict], backup_time: datetime,
+               max_concurrency: int) -> Tuple[int, int, List[str], Dict[str, str]]:
+    """
+    Back up a slice of devices in a worker process.
+
+    Only picklable arguments cross the process boundary, so the worker
+    builds its own managers from the configuration directory. It runs at
+    most max_concurrency backups at once, its share of the setting.
+
+    Returns:
+        Tuple of (successful_backups, failed_backups, error_messages, device_types)
+    """
+    backup_manager = BackupManager(ConfigManager(config_dir))
+    try:
+        success, fail, errors = asyncio.run(
+            backup_manager._gather_backups(devices, backup_time, max_concurrency)
+        )
+        return success, fail, errors, backup_manager._last_good
+    finally:
+        # Sessions cannot outlive the worker, so close them explicitly
+        backup_manager.device_manager.close_all()
@@ -7,9 +7,16 @@ Handles loading and validation of device configurations and application settings
 import yaml
 import os
 import logging
+from functools import cached_property
 from typing import Dict, List, Any
 from pathlib import Path
 
+try:
+    # libyaml C bindings parse and emit much faster than the pure-Python ones
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 class ConfigManager:
     """Manages configuration loading and validation."""
@@ -24,11 +31,16 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.devices_config = None
         self.settings_config = None
+        self._devices_mtime = None
+        self._settings_mtime = None
         self.logger = logging.getLogger(__name__)
 
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(exist_ok=True)
 
+        # Load settings up front so getters never need to
+        self.load_settings_config()
+
     def load_devices_config(self) -> List[Dict[str, Any]]:
         """
         Load device configuration from devices.yaml.
@@ -44,20 +56,26 @@ class ConfigManager:
 
         if not devices_file.exists():
             self._create_sample_devices_config()
-            self.logger.warning(f"Created sample devices config at {devices_file}")
+            self.logger.warning("Created sample devices config at %s", devices_file)
 
         try:
+            # Reuse the parsed config until the file changes on disk
+            mtime = devices_file.stat().st_mtime_ns
+            if self.devices_config is not None and mtime == self._devices_mtime:
+                return self.devices_config
+
             with open(devices_file, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=SafeLoader)
                 self.devices_config = config.get('devices', [])
                 self._validate_devices_config()
+                self._devices_mtime = mtime
                 return self.devices_config
 
         except yaml.YAMLError as e:
-            self.logger.error(f"Error parsing devices.yaml: {e}")
+            self.logger.error("Error parsing devices.yaml: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Error loading devices config: {e}")
+            self.logger.error("Error loading devices config: %s", e)
             raise
 
     def load_settings_config(self) -> Dict[str, Any]:
@@ -75,19 +93,28 @@ class ConfigManager:
 
         if not settings_file.exists():
             self._create_sample_settings_config()
-            self.logger.warning(f"Created sample settings config at {settings_file}")
+            self.logger.warning("Created sample settings config at %s", settings_file)
 
         try:
+            # Reuse the parsed settings until the file changes on disk
+            mtime = settings_file.stat().st_mtime_ns
+            if self.settings_config is not None and mtime == self._settings_mtime:
+                return self.settings_config
+
             with open(settings_file, 'r', encoding='utf-8') as file:
-                self.settings_config = yaml.safe_load(file)
+                self.settings_config = yaml.load(file, Loader=SafeLoader)
                 self._validate_settings_config()
+                self._settings_mtime = mtime
+
+                # Keep the memoized settings in step so getters see the reloaded file
+                self.__dict__['settings'] = self.settings_config
                 return self.settings_config
 
         except yaml.YAMLError as e:
-            self.logger.error(f"Error parsing settings.yaml: {e}")
+            self.logger.error("Error parsing settings.yaml: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Error loading settings config: {e}")
+            self.logger.error("Error loading settings config: %s", e)
             raise
 
     def _validate_devices_config(self):
@@ -120,7 +147,10 @@ class ConfigManager:
                 'backup_directory': './backups',
                 'retention_days': 7,
                 'schedule_day': 'sunday',
-                'schedule_time': '02:00'
+                'schedule_time': '02:00',
+                'max_concurrency': 32,
+                'worker_processes': 1,
+                'archive_per_run': False
             },
             'email': {
                 'enabled': False,
@@ -133,6 +163,11 @@ class ConfigManager:
             'logging': {
                 'level': 'INFO',
                 'log_file': './logs/network_backup.log'
+            },
+            'ssh': {
+                'ssh_config_file': '',
+                'fast_cli': True,
+                'global_delay_factor': 1
             }
         }
 
@@ -169,7 +204,7 @@ class ConfigManager:
 
         devices_file = self.config_dir / "devices.yaml"
         with open(devices_file, 'w', encoding='utf-8') as file:
-            yaml.dump(sample_config, file, default_flow_style=False, indent=2)
+            yaml.dump(sample_config, file, Dumper=SafeDumper, default_flow_style=False, indent=2)
 
     def _create_sample_settings_config(self):
         """Create a sample settings configuration file."""
@@ -178,7 +213,10 @@ class ConfigManager:
                 'backup_directory': './backups',
                 'retention_days': 7,
                 'schedule_day': 'sunday',
-                'schedule_time': '02:00'
+                'schedule_time': '02:00',
+                'max_concurrency': 32,
+                'worker_processes': 1,
+                'archive_per_run': False
             },
             'email': {
                 'enabled': False,
@@ -191,24 +229,43 @@ class ConfigManager:
             'logging': {
                 'level': 'INFO',
                 'log_file': './logs/network_backup.log'
+            },
+            'ssh': {
+                'ssh_config_file': '',
+                'fast_cli': True,
+                'global_delay_factor': 1
             }
         }
 
         settings_file = self.config_dir / "settings.yaml"
         with open(settings_file, 'w', encoding='utf-8') as file:
-            yaml.dump(sample_config, file, default_flow_style=False, indent=2)
+            yaml.dump(sample_config, file, Dumper=SafeDumper, default_flow_style=False, indent=2)
+
+    @cached_property
+    def settings(self) -> Dict[str, Any]:
+        """Application settings, refreshed whenever settings.yaml is reloaded."""
+        return self.load_settings_config()
 
     def get_backup_directory(self) -> str:
         """Get the configured backup directory."""
-        if not self.settings_config:
-            self.load_settings_config()
-        return self.settings_config['backup']['backup_directory']
+        return self.settings['backup']['backup_directory']
 
     def get_retention_days(self) -> int:
         """Get the configured retention period in days."""
-        if not self.settings_config:
-            self.load_settings_config()
-        return self.settings_config['backup']['retention_days']
+        return self.settings['backup']['retention_days']
+
+    def get_max_concurrency(self) -> int:
+        """Get the maximum number of devices backed up concurrently, across all worker processes."""
+        return max(1, int(self.settings['backup']['max_concurrency']))
+
+    def get_worker_processes(self) -> int:
+        """Get the number of backup worker processes (0 means one per CPU)."""
+        worker_processes = int(self.settings['backup']['worker_processes'])
+        return worker_processes if worker_processes > 0 else (os.cpu_count() or 1)
+
+    def get_archive_per_run(self) -> bool:
+        """Whether each backup run is written as a single tar.zst archive."""
+        return bool(self.settings['backup']['archive_per_run'])
 
     def get_schedule_info(self) -> tuple:
         """
@@ -217,21 +274,19 @@ class ConfigManager:
         Returns:
             Tuple of (day, time) for scheduling
         """
-        if not self.settings_config:
-            self.load_settings_config()
         return (
-            self.settings_config['backup']['schedule_day'],
-            self.settings_config['backup']['schedule_time']
+            self.settings['backup']['schedule_day'],
+            self.settings['backup']['schedule_time']
         )
 
     def get_email_config(self) -> Dict[str, Any]:
         """Get email configuration."""
-        if not self.settings_config:
-            self.load_settings_config()
-        return self.settings_config['email']
+        return self.settings['email']
 
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration."""
-        if not self.settings_config:
-            self.load_settings_config()
-        return self.settings_config['logging']
+        return self.settings['logging']
+
+    def get_ssh_config(self) -> Dict[str, Any]:
+        """Get SSH connection settings."""
+        return self.settings['ssh']
@@ -5,50 +5,366 @@ Handles SSH connections and communication with network devices.
 """
 
 import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
-from netmiko import ConnectHandler, NetmikoTimeoutException, NetmikoAuthenticationException
+from netmiko import ConnectHandler, SSHDetect, NetmikoTimeoutException, NetmikoAuthenticationException
 from netmiko.exceptions import NetmikoBaseException
 import paramiko
 
 
+logger = logging.getLogger(__name__)
+
+
+# Command that dumps the running configuration, per Netmiko device type
+_CONFIG_COMMANDS = MappingProxyType({
+    'cisco_ios': 'show running-config',
+    'cisco_xe': 'show running-config',
+    'cisco_nxos': 'show running-config',
+    'cisco_asa': 'show running-config',
+    'juniper': 'show configuration',
+    'juniper_junos': 'show configuration',
+    'arista_eos': 'show running-config',
+    'hp_comware': 'display current-configuration',
+    'hp_procurve': 'show config',
+    'fortinet': 'show full-configuration',
+    'paloalto_panos': 'show config running',
+    'dell_force10': 'show running-config',
+    'dell_powerconnect': 'show running-config',
+    'extreme': 'show configuration',
+    'extreme_exos': 'show configuration',
+    'mikrotik_routeros': '/export',
+    'vyos': 'show configuration',
+    'linux': 'cat /etc/network/interfaces'  # Example for Linux systems
+})
+
+# Seconds to wait for a command's output to finish; large configs
+# from slow devices need far longer than a one-screen show command
+CONFIG_READ_TIMEOUT = 120
+SHOW_READ_TIMEOUT = 10
+
+# Connection timeouts in seconds; short so a dead device fails fast. A TCP
+# failure is final, while a stalled SSH handshake (slow banner, dropped
+# session) gets one retry after CONNECT_RETRY_DELAY: worst case 6 + 1 + 6 s,
+# under the 15 s Netmiko's default banner_timeout could take
+CONN_TIMEOUT = 5
+BANNER_TIMEOUT = 6
+AUTH_TIMEOUT = 8
+CONNECT_RETRY_DELAY = 1
+
+
+# Netmiko options under which the host must stay as written
+_NAME_SENSITIVE_OPTIONS = ('ssh_config_file', 'ssh_strict', 'system_host_keys', 'alt_host_keys')
+
+
+@lru_cache(maxsize=1024)
+def _resolve(host: str) -> str:
+    """
+    Resolve a device hostname to an address, memoized until cleared.
+
+    Args:
+        host: Hostname or address from the device entry
+
+    Returns:
+        The host's address if it has exactly one; otherwise host unchanged,
+        so paramiko can fall back through several addresses itself and
+        Netmiko reports a name that does not resolve
+    """
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError):
+        return host
+    return addresses.pop() if len(addresses) == 1 else host
+
+
 class DeviceManager:
     """Manages network device connections and operations."""
 
-    def __init__(self):
-        """Initialize DeviceManager."""
-        self.logger = logging.getLogger(__name__)
-        self.active_connections = {}
+    def __init__(self, max_connections: int = 64, idle_timeout: float = 300,
+                 ssh_config_path: Optional[str] = None, fast_cli: bool = True,
+                 global_delay_factor: float = 1):
+        """
+        Initialize DeviceManager.
 
-    def test_connection(self, device_config: Dict) -> Tuple[bool, str]:
+        Args:
+            max_connections: Maximum number of idle SSH sessions kept for reuse
+            idle_timeout: Seconds an unused session stays open before it is closed
+            ssh_config_path: OpenSSH config file applied to every connection,
+                e.g. for a multiplexed ProxyJump host
+            fast_cli: Let Netmiko shorten its safety sleeps between reads
+                (Netmiko's default); disable it for slow or lossy links
+            global_delay_factor: Multiplier for Netmiko's sleeps; Netmiko's
+                default of 1 is lowered to 0.1 when fast_cli is on, so only
+                raise it for slow or lossy links
         """
-        Test connection to a network device.
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.ssh_config_path = ssh_config_path
+        self.fast_cli = fast_cli
+        self.global_delay_factor = global_delay_factor
+
+        # Idle sessions, least recently used first:
+        # (host, device_type, username, port) -> (connection, last_used)
+        self.active_connections = OrderedDict()
+        self._connections_lock = threading.Lock()
+
+        # Prepared Netmiko parameters, keyed by the device entry's contents
+        self._prepare_cached = lru_cache(maxsize=1024)(
+            lambda items: self._prepare(dict(items))
+        )
+
+    def _prepare(self, device_config: Dict) -> Tuple[str, Dict]:
+        """Build the display name and Netmiko parameters for a device entry."""
+        netmiko_config = device_config.copy()
+
+        # Use name if available, otherwise use IP as device identifier;
+        # Netmiko doesn't take 'name'
+        device_name = netmiko_config.pop('name', netmiko_config.get('ip', 'unknown'))
+
+        # Ensure 'host' is set (Netmiko requires it)
+        if 'host' not in netmiko_config:
+            netmiko_config['host'] = netmiko_config['ip']
+
+        if self.ssh_config_path:
+            netmiko_config.setdefault('ssh_config_file', self.ssh_config_path)
+
+        # Device entries may override the manager-wide timing
+        netmiko_config.setdefault('fast_cli', self.fast_cli)
+        netmiko_config.setdefault('global_delay_factor', self.global_delay_factor)
+        netmiko_config.setdefault('conn_timeout', CONN_TIMEOUT)
+        netmiko_config.setdefault('banner_timeout', BANNER_TIMEOUT)
+        netmiko_config.setdefault('auth_timeout', AUTH_TIMEOUT)
+
+        return device_name, netmiko_config
+
+    def _normalize(self, device_config: Dict) -> Tuple[str, Dict]:
+        """
+        Get the display name and Netmiko parameters for a device entry.
+
+        The result is memoized on the entry's contents, so repeat runs over
+        an unchanged inventory reuse it. Callers must not mutate the
+        returned dict.
 
         Args:
             device_config: Device configuration dictionary
 
         Returns:
-            Tuple of (success_status, message)
+            Tuple of (device_name, netmiko_config)
         """
-        # Create a copy of the device config for Netmiko
-        netmiko_config = device_config.copy()
+        try:
+            items = frozenset(device_config.items())
+        except TypeError:
+            # Unhashable values can't key the cache
+            return self._prepare(device_config)
+        return self._prepare_cached(items)
+
+    @staticmethod
+    def _connection_key(netmiko_config: Dict) -> Tuple:
+        """Identify a reusable session by everything that shapes it."""
+        return (
+            netmiko_config['host'],
+            netmiko_config['device_type'],
+            netmiko_config.get('username'),
+            netmiko_config.get('port', 22)
+        )
+
+    def _get_or_connect(self, netmiko_config: Dict):
+        """
+        Check out an open session to the device, connecting if none is cached.
 
-        # Use name if available, otherwise use IP as device identifier
-        device_name = netmiko_config.get('name', netmiko_config.get('ip', 'unknown'))
+        A checked-out session is removed from the cache, so no two threads
+        ever share it. Hand it back with _release_connection.
 
-        # Remove 'name' from the config as Netmiko doesn't use it
-        if 'name' in netmiko_config:
-            del netmiko_config['name']
+        Args:
+            netmiko_config: Netmiko connection parameters
 
-        # Ensure 'host' is set (Netmiko requires it)
-        if 'host' not in netmiko_config:
-            netmiko_config['host'] = netmiko_config['ip']
+        Returns:
+            Netmiko connection object
+        """
+        self.close_idle_connections()
+
+        with self._connections_lock:
+            cached = self.active_connections.pop(self._connection_key(netmiko_config), None)
+
+        if cached is not None:
+            connection = cached[0]
+            if connection.is_alive():
+                logger.debug("Reusing open session to %s", netmiko_config['host'])
+                return connection
+            self._disconnect(connection)
+
+        return self._connect(netmiko_config)
+
+    def _connect(self, netmiko_config: Dict):
+        """
+        Open a Netmiko session and tune its TCP socket.
+
+        A stalled SSH handshake is retried once; TCP and authentication
+        failures are not. Disables Nagle's algorithm so short commands and
+        prompt exchanges are not held back by delayed ACKs, and enables TCP
+        keepalive so dead peers of cached sessions are noticed.
+
+        Args:
+            netmiko_config: Netmiko connection parameters
+
+        Returns:
+            Netmiko connection object
+        """
+        # An ssh_config file matches Host patterns on the name, a ProxyJump
+        # resolves it from the jump host, and known_hosts entries may be keyed
+        # by it, so leave the name alone in those cases
+        if not any(netmiko_config.get(key) for key in _NAME_SENSITIVE_OPTIONS):
+            netmiko_config = dict(netmiko_config, host=_resolve(netmiko_config['host']))
 
         try:
             connection = ConnectHandler(**netmiko_config)
+        except NetmikoTimeoutException as e:
+            # Netmiko raises this for socket errors too; an unreachable or
+            # silent host won't answer a retry either
+            if isinstance(e.__context__, OSError):
+                raise
+            logger.info("SSH handshake with %s failed, retrying in %s s",
+                        netmiko_config['host'], CONNECT_RETRY_DELAY)
+            time.sleep(CONNECT_RETRY_DELAY)
+            connection = ConnectHandler(**netmiko_config)
 
-            # Test basic command
-            output = connection.send_command("show version", max_loops=10)
+        try:
+            sock = connection.remote_conn.get_transport().sock
+        except AttributeError:
+            # Telnet and serial sessions have no paramiko transport
+            return connection
+
+        # A ProxyCommand/ProxyJump transport is a pipe, not a TCP socket
+        if isinstance(sock, socket.socket):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if hasattr(socket, 'TCP_KEEPIDLE'):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            except OSError as e:
+                logger.debug("Could not set socket options for %s: %s", netmiko_config['host'], e)
+
+        return connection
+
+    def _release_connection(self, netmiko_config: Dict, connection):
+        """
+        Return a session to the cache, evicting the least recently used beyond max_connections.
+
+        A session already cached under the same key is closed.
+
+        Args:
+            netmiko_config: Netmiko connection parameters the session was opened with
+            connection: Netmiko connection object
+        """
+        key = self._connection_key(netmiko_config)
+
+        with self._connections_lock:
+            # Two checkouts of one key (e.g. overlapping runs) both come back;
+            # keep the fresher session and close the one it replaces
+            replaced = self.active_connections.pop(key, None)
+            evicted = [replaced[0]] if replaced is not None else []
+
+            self.active_connections[key] = (connection, time.monotonic())
+
+            while len(self.active_connections) > self.max_connections:
+                evicted.append(self.active_connections.popitem(last=False)[1][0])
+
+        for stale in evicted:
+            self._disconnect(stale)
+
+    @staticmethod
+    def clear_dns_cache():
+        """Forget resolved device addresses so the next connections look them up again."""
+        _resolve.cache_clear()
+
+    def close_idle_connections(self):
+        """Close cached sessions that have been unused for longer than idle_timeout."""
+        now = time.monotonic()
+
+        with self._connections_lock:
+            expired = [
+                key for key, (_, last_used) in self.active_connections.items()
+                if now - last_used > self.idle_timeout
+            ]
+            connections = [self.active_connections.pop(key)[0] for key in expired]
+
+        for connection in connections:
+            self._disconnect(connection)
+
+    def close_all(self):
+        """Close every cached session."""
+        with self._connections_lock:
+            connections = [connection for connection, _ in self.active_connections.values()]
+            self.active_connections.clear()
+
+        for connection in connections:
+            self._disconnect(connection)
+
+    def _send_command(self, netmiko_config: Dict, command: str, **kwargs) -> str:
+        """
+        Run a command on a reusable session to the device.
+
+        The session goes back to the cache afterwards, unless the command
+        failed, in which case it is closed.
+
+        Args:
+            netmiko_config: Netmiko connection parameters
+            command: Command to send
+            **kwargs: Extra arguments for Netmiko's send_command
+
+        Returns:
+            Command output
+        """
+        return self._send_commands(netmiko_config, [(command, kwargs)])[0]
+
+    def _send_commands(self, netmiko_config: Dict, commands: List[Tuple[str, Dict]]) -> List[str]:
+        """
+        Run several commands back to back on one reusable session.
+
+        Args:
+            netmiko_config: Netmiko connection parameters
+            commands: (command, send_command keyword arguments) pairs
+
+        Returns:
+            Output of each command, in order
+        """
+        connection = self._get_or_connect(netmiko_config)
+        try:
+            outputs = [connection.send_command(command, **kwargs) for command, kwargs in commands]
+        except Exception:
+            self._disconnect(connection)
+            raise
+
+        self._release_connection(netmiko_config, connection)
+        return outputs
+
+    def _disconnect(self, connection):
+        """Disconnect a session, ignoring errors from already-dead transports."""
+        try:
             connection.disconnect()
+        except Exception as e:
+            logger.debug("Error closing session: %s", e)
+
+    def test_connection(self, device_config: Dict) -> Tuple[bool, str]:
+        """
+        Test connection to a network device.
+
+        Args:
+            device_config: Device configuration dictionary
+
+        Returns:
+            Tuple of (success_status, message)
+        """
+        device_name, netmiko_config = self._normalize(device_config)
+
+        try:
+            # Test basic command
+            output = self._send_command(netmiko_config, "show version", read_timeout=SHOW_READ_TIMEOUT)
 
             if output:
                 return True, f"Successfully connected to {device_name}"
@@ -74,57 +390,100 @@ class DeviceManager:
         Returns:
             Tuple of (success_status, configuration_text, error_message)
         """
-        # Create a copy of the device config for Netmiko
-        netmiko_config = device_config.copy()
-
-        # Use name if available, otherwise use IP as device identifier
-        device_name = netmiko_config.get('name', netmiko_config.get('ip', 'unknown'))
+        success, _, configuration, error_msg = self.get_device_info_and_config(
+            device_config, include_info=False
+        )
+        return success, configuration, error_msg
 
-        # Remove 'name' from the config as Netmiko doesn't use it
-        if 'name' in netmiko_config:
-            del netmiko_config['name']
-
-        # Ensure 'host' is set (Netmiko requires it)
-        if 'host' not in netmiko_config:
-            netmiko_config['host'] = netmiko_config['ip']
+    def get_device_info_and_config(self, device_config: Dict, include_info: bool = True,
+                                   include_config: bool = True) -> Tuple[bool, Dict, str, str]:
+        """
+        Retrieve device information and configuration over one session.
 
-        try:
-            self.logger.info(f"Connecting to {device_name} ({netmiko_config['ip']})")
+        Args:
+            device_config: Device configuration dictionary
+            include_info: Run "show version" for the device information
+            include_config: Retrieve the device configuration
 
-            connection = ConnectHandler(**netmiko_config)
+        Returns:
+            Tuple of (success_status, device_info_dict, configuration_text, error_message);
+            the dict or text is empty when not requested
+        """
+        device_name, netmiko_config = self._normalize(device_config)
 
+        commands = []
+        if include_info:
+            commands.append(("show version", {'read_timeout': SHOW_READ_TIMEOUT}))
+        if include_config:
             # Get configuration based on device type
             config_command = self._get_config_command(netmiko_config['device_type'])
+            commands.append((config_command, {'read_timeout': CONFIG_READ_TIMEOUT}))
 
-            self.logger.info(f"Retrieving configuration from {device_name}")
-            configuration = connection.send_command(config_command, max_loops=100)
-
-            connection.disconnect()
-
-            if configuration:
-                self.logger.info(f"Successfully retrieved configuration from {device_name}")
-                return True, configuration, ""
-            else:
-                error_msg = f"No configuration received from {device_name}"
-                self.logger.error(error_msg)
-                return False, "", error_msg
+        try:
+            logger.info("Connecting to %s (%s)", device_name, netmiko_config['ip'])
+            if include_config:
+                logger.info("Retrieving configuration from %s", device_name)
+            outputs = self._send_commands(netmiko_config, commands)
+
+            device_info = {}
+            if include_info:
+                device_info = {
+                    'name': device_name,
+                    'ip': netmiko_config['ip'],
+                    'device_type': netmiko_config['device_type'],
+                    'version_info': outputs[0]
+                }
+
+            configuration = ""
+            if include_config:
+                configuration = outputs[-1]
+                if not configuration:
+                    error_msg = f"No configuration received from {device_name}"
+                    logger.error(error_msg)
+                    return False, device_info, "", error_msg
+                logger.info("Successfully retrieved configuration from %s", device_name)
+
+            return True, device_info, configuration, ""
 
         except NetmikoTimeoutException:
             error_msg = f"Timeout connecting to {device_name}"
-            self.logger.error(error_msg)
-            return False, "", error_msg
         except NetmikoAuthenticationException:
             error_msg = f"Authentication failed for {device_name}"
-            self.logger.error(error_msg)
-            return False, "", error_msg
         except NetmikoBaseException as e:
             error_msg = f"SSH error connecting to {device_name}: {str(e)}"
-            self.logger.error(error_msg)
-            return False, "", error_msg
         except Exception as e:
-            error_msg = f"Unexpected error retrieving config from {device_name}: {str(e)}"
-            self.logger.error(error_msg)
-            return False, "", error_msg
+            error_msg = f"Unexpected error retrieving data from {device_name}: {str(e)}"
+
+        logger.error(error_msg)
+        return False, {}, "", error_msg
+
+    def detect_device_type(self, device_config: Dict) -> Optional[str]:
+        """
+        Probe a device with Netmiko's SSHDetect to find its device type.
+
+        Args:
+            device_config: Device configuration dictionary
+
+        Returns:
+            Best-matching Netmiko device_type, or None if detection failed
+        """
+        device_name, netmiko_config = self._normalize(device_config)
+        netmiko_config = dict(netmiko_config, device_type='autodetect')
+
+        try:
+            logger.info("Detecting device type of %s", device_name)
+            guesser = SSHDetect(**netmiko_config)
+            try:
+                device_type = guesser.autodetect()
+            finally:
+                guesser.connection.disconnect()
+
+            logger.info("Detected %s as %s", device_name, device_type)
+            return device_type
+
+        except Exception as e:
+            logger.error("Error detecting device type of %s: %s", device_name, e)
+            return None
 
     def _get_config_command(self, device_type: str) -> str:
         """
@@ -136,66 +495,86 @@ class DeviceManager:
         Returns:
             Configuration command string
         """
-        # Command mapping for different device types
-        config_commands = {
-            'cisco_ios': 'show running-config',
-            'cisco_xe': 'show running-config',
-            'cisco_nxos': 'show running-config',
-            'cisco_asa': 'show running-config',
-            'juniper': 'show configuration',
-            'juniper_junos': 'show configuration',
-            'arista_eos': 'show running-config',
-            'hp_comware': 'display current-configuration',
-            'hp_procurve': 'show config',
-            'fortinet': 'show full-configuration',
-            'paloalto_panos': 'show config running',
-            'dell_force10': 'show running-config',
-            'dell_powerconnect': 'show running-config',
-            'extreme': 'show configuration',
-            'extreme_exos': 'show configuration',
-            'mikrotik_routeros': '/export',
-            'vyos': 'show configuration',
-            'linux': 'cat /etc/network/interfaces'  # Example for Linux systems
-        }
-
         # Default to Cisco IOS command if device type not found
-        return config_commands.get(device_type.lower(), 'show running-config')
+        return _CONFIG_COMMANDS.get(device_type.lower(), 'show running-config')
 
-    def test_all_devices(self, devices: List[Dict]) -> List[Tuple[str, bool, str]]:
+    def prewarm(self, devices: List[Dict], max_workers: Optional[int] = None) -> int:
         """
-        Test connections to all devices.
+        Open sessions to devices ahead of a backup and park them in the cache.
+
+        Devices set to autodetect are skipped, since their session key
+        depends on the type detected at backup time. At most
+        max_connections sessions are opened, so none are evicted unused.
 
         Args:
             devices: List of device configuration dictionaries
+            max_workers: Maximum concurrent connections (default: min(32, len(devices)))
 
         Returns:
-            List of tuples (hostname, success_status, message)
+            Number of sessions opened
+        """
+        devices = [device for device in devices
+                   if device.get('device_type') != 'autodetect'][:self.max_connections]
+        if not devices:
+            return 0
+
+        def warm(device: Dict) -> bool:
+            device_name, netmiko_config = self._normalize(device)
+            try:
+                connection = self._get_or_connect(netmiko_config)
+            except Exception as e:
+                logger.warning("Could not pre-open session to %s: %s", device_name, e)
+                return False
+            self._release_connection(netmiko_config, connection)
+            return True
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(devices))) as executor:
+            return sum(executor.map(warm, devices))
+
+    def test_all_devices(self, devices: List[Dict], max_workers: Optional[int] = None) -> List[Tuple[str, bool, str]]:
         """
-        results = []
+        Test connections to all devices in parallel.
 
-        for device in devices:
-            device_name = device.get('name', device.get('ip', 'unknown'))
-            success, message = self.test_connection(device)
-            results.append((device_name, success, message))
+        Args:
+            devices: List of device configuration dictionaries
+            max_workers: Maximum concurrent connections (default: min(32, len(devices)))
 
-        return results
+        Returns:
+            List of tuples (hostname, success_status, message), in input order
+        """
+        if not devices:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(devices))) as executor:
+            outcomes = list(executor.map(self.test_connection, devices))
+
+        return [
+            (device.get('name', device.get('ip', 'unknown')), success, message)
+            for device, (success, message) in zip(devices, outcomes)
+        ]
 
-    def backup_all_devices(self, devices: List[Dict]) -> List[Tuple[str, bool, str, str]]:
+    def backup_all_devices(self, devices: List[Dict], max_workers: Optional[int] = None) -> List[Tuple[str, bool, str, str]]:
         """
-        Backup configurations from all devices.
+        Backup configurations from all devices in parallel.
 
         Args:
             devices: List of device configuration dictionaries
+            max_workers: Maximum concurrent connections (default: min(32, len(devices)))
 
         Returns:
-            List of tuples (hostname, success_status, configuration, error_message)
+            List of tuples (hostname, success_status, configuration, error_message), in input order
         """
-        results = []
+        if not devices:
+            return []
 
-        for device in devices:
-            device_name = device.get('name', device.get('ip', 'unknown'))
-            success, config, error = self.get_device_config(device)
-            results.append((device_name, success, config, error))
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(devices))) as executor:
+            futures = [executor.submit(self.get_device_config, device) for device in devices]
+
+            results = []
+            for device, future in zip(devices, futures):
+                device_name = device.get('name', device.get('ip', 'unknown'))
+                success, config, error = future.result()
+                results.append((device_name, success, config, error))
 
         return results
 
@@ -209,41 +588,10 @@ class DeviceManager:
         Returns:
             Tuple of (success_status, device_info_dict, error_message)
         """
-        # Create a copy of the device config for Netmiko
-        netmiko_config = device_config.copy()
-
-        # Use name if available, otherwise use IP as device identifier
-        device_name = netmiko_config.get('name', netmiko_config.get('ip', 'unknown'))
-
-        # Remove 'name' from the config as Netmiko doesn't use it
-        if 'name' in netmiko_config:
-            del netmiko_config['name']
-
-        # Ensure 'host' is set (Netmiko requires it)
-        if 'host' not in netmiko_config:
-            netmiko_config['host'] = netmiko_config['ip']
-
-        try:
-            connection = ConnectHandler(**netmiko_config)
-
-            # Get device information
-            version_output = connection.send_command("show version", max_loops=10)
-
-            device_info = {
-                'name': device_name,
-                'ip': netmiko_config['ip'],
-                'device_type': netmiko_config['device_type'],
-                'version_info': version_output
-            }
-
-            connection.disconnect()
-
-            return True, device_info, ""
-
-        except Exception as e:
-            error_msg = f"Error getting device info from {device_name}: {str(e)}"
-            self.logger.error(error_msg)
-            return False, {}, error_msg
+        success, device_info, _, error_msg = self.get_device_info_and_config(
+            device_config, include_config=False
+        )
+        return success, device_info, error_msg
 
 if __name__ == "__main__":
     import argparse
@@ -286,9 +634,9 @@ if __name__ == "__main__":
 
         for hostname, success, config, error in backup_results:
             if success:
-                logging.info(f"Backup successful for {hostname}")
+                logging.info("Backup successful for %s", hostname)
             else:
-                logging.error(f"Backup failed for {hostname}: {error}")
+                logging.error("Backup failed for %s: %s", hostname, error)
 
     if args.test:
         logging.info("Testing connections to all devices...")
@@ -296,6 +644,6 @@ if __name__ == "__main__":
 
         for hostname, success, message in test_results:
             if success:
-                logging.info(f"Connection successful to {hostname}")
+                logging.info("Connection successful to %s", hostname)
             else:
-                logging.error(f"Connection failed to {hostname}: {message}")
+                logging.error("Connection failed to %s: %s", hostname, message)
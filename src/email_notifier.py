@@ -4,14 +4,32 @@ Email Notifier for Network Device Backup Tool
 Handles sending email notifications on backup success/failure.
 """
 
+import asyncio
 import smtplib
+import ssl
 import logging
+import time
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List
 
+
+logger = logging.getLogger(__name__)
+
+
 class EmailNotifier:
     """Handles email notifications for backup events."""
+
+    # Port for implicit TLS; other ports upgrade with STARTTLS
+    SMTPS_PORT = 465
+    # A shared session idle longer than this is probed with NOOP before reuse
+    KEEPALIVE_INTERVAL = 30
+
+    # Built once and shared by every notifier, so each connection skips
+    # reloading the system CA certificates
+    _ssl_context = None
+
     def __init__(self, email_config: dict):
         self.enabled = email_config.get('enabled', False)
         self.smtp_server = email_config.get('smtp_server', '')
@@ -19,11 +37,74 @@ class EmailNotifier:
         self.sender_email = email_config.get('sender_email', '')
         self.sender_password = email_config.get('sender_password', '')
         self.recipient_email = email_config.get('recipient_email', '')
-        self.logger = logging.getLogger(__name__)
+        self._session = None
+        self._last_used = 0.0
+
+        # Connecting to an empty server name stalls for the OS connect timeout
+        if self.enabled and not self._is_configured():
+            logger.error("Email notifications disabled: smtp_server, sender_email "
+                         "and recipient_email must all be set.")
+            self.enabled = False
+
+    def _is_configured(self) -> bool:
+        return bool(self.smtp_server and self.sender_email and self.recipient_email)
+
+    @classmethod
+    def _get_ssl_context(cls) -> ssl.SSLContext:
+        if cls._ssl_context is None:
+            cls._ssl_context = ssl.create_default_context()
+        return cls._ssl_context
+
+    def _connect(self) -> smtplib.SMTP:
+        context = self._get_ssl_context()
+        if self.smtp_port == self.SMTPS_PORT:
+            # Implicit TLS skips the STARTTLS round-trip
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=context)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self.smtp_port != self.SMTPS_PORT:
+                server.starttls(context=context)
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._last_used = time.monotonic()
+        return server
+
+    def _reuse_session(self) -> smtplib.SMTP:
+        # Reconnect if the server dropped the shared session while it sat idle
+        if time.monotonic() - self._last_used > self.KEEPALIVE_INTERVAL:
+            try:
+                self._session.noop()
+            except (smtplib.SMTPException, OSError):
+                self._session.close()
+                self._session = self._connect()
+        self._last_used = time.monotonic()
+        return self._session
+
+    @contextmanager
+    def session(self):
+        # Emails sent inside the block share one SMTP connection; nested
+        # blocks reuse the outer one
+        if self._session is not None:
+            yield self._reuse_session()
+            return
+        self._session = self._connect()
+        try:
+            yield self._session
+        finally:
+            server, self._session = self._session, None
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
 
     def send_notification(self, subject: str, body: str) -> bool:
         if not self.enabled:
-            self.logger.info("Email notifications are disabled.")
+            logger.info("Email notifications are disabled.")
+            return False
+        if not self._is_configured():
             return False
         try:
             msg = MIMEMultipart()
@@ -32,14 +113,12 @@ class EmailNotifier:
             msg['Subject'] = subject
             msg.attach(MIMEText(body, 'plain'))
 
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
+            with self.session() as server:
                 server.send_message(msg)
-            self.logger.info(f"Email sent: {subject}")
+            logger.info("Email sent: %s", subject)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to send email: {e}")
+            logger.error("Failed to send email: %s", e)
             return False
 
     def send_backup_report(self, success_count: int, fail_count: int, errors: List[str]):
@@ -48,3 +127,8 @@ class EmailNotifier:
         if errors:
             body += "\nErrors:\n" + "\n".join(errors)
         self.send_notification(subject, body)
+
+    async def send_backup_report_async(self, success_count: int, fail_count: int, errors: List[str]):
+        # smtplib blocks, so send from the loop's executor to keep the loop free
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send_backup_report, success_count, fail_count, errors)
@@ -4,30 +4,78 @@ Scheduler for Network Device Backup Tool
 Handles automated scheduling of backup operations.
 """
 
+import asyncio
 import logging
-import time
+import signal
+import threading
 from datetime import datetime
-from typing import Callable
-from apscheduler.schedulers.blocking import BlockingScheduler
+from typing import Callable, Optional
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from .config_manager import ConfigManager
+from .device_manager import DeviceManager
+
+
+logger = logging.getLogger(__name__)
+
+
+# Minutes before the backup that device sessions are opened
+PREWARM_LEAD_MINUTES = 1
+
+# Longest single sleep of the simple scheduler. Event.wait times out on the
+# monotonic clock, which does not advance while the host is suspended, so
+# the wall-clock schedule is re-checked at least this often.
+MAX_IDLE_WAIT_SECONDS = 60
+
+# Day names accepted in settings, mapped to weekday numbers (Monday=0, Sunday=6)
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+
+def _parse_schedule_day(schedule_day: str) -> str:
+    """
+    Normalize a configured schedule day.
+
+    Args:
+        schedule_day: Day name from settings, in any case
+
+    Returns:
+        Lower-case day name, a key of WEEKDAYS
+
+    Raises:
+        ValueError: If the day is not a weekday name
+    """
+    day = schedule_day.lower()
+    if day not in WEEKDAYS:
+        raise ValueError(f"Invalid schedule day: {schedule_day}")
+    return day
 
 
 class BackupScheduler:
     """Manages automated backup scheduling."""
 
-    def __init__(self, config_manager: ConfigManager, backup_function: Callable):
+    def __init__(self, config_manager: ConfigManager, backup_function: Callable,
+                 device_manager: Optional[DeviceManager] = None):
         """
         Initialize BackupScheduler.
 
         Args:
             config_manager: ConfigManager instance
-            backup_function: Function to call for backups
+            backup_function: Function or coroutine function to call for backups
+            device_manager: DeviceManager whose cached SSH sessions the scheduler
+                reaps while idle and closes on shutdown
         """
         self.config_manager = config_manager
         self.backup_function = backup_function
-        self.scheduler = BlockingScheduler()
-        self.logger = logging.getLogger(__name__)
+        self.device_manager = device_manager
+
+        # Jobs run on this loop, so coroutine backup functions share it
+        # with their SSH sessions instead of bouncing through a thread
+        self.loop = asyncio.new_event_loop()
+        self.scheduler = AsyncIOScheduler(event_loop=self.loop)
+        self.weekday = None
 
     def start_scheduler(self):
         """Start the backup scheduler."""
@@ -38,17 +86,11 @@ class BackupScheduler:
             # Parse schedule time (format: HH:MM)
             hour, minute = map(int, schedule_time.split(':'))
 
-            # Map day names to weekday numbers (Monday=0, Sunday=6)
-            day_mapping = {
-                'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                'friday': 4, 'saturday': 5, 'sunday': 6
-            }
+            self.weekday = WEEKDAYS[_parse_schedule_day(schedule_day)]
 
-            weekday = day_mapping.get(schedule_day.lower())
-            if weekday is None:
-                raise ValueError(f"Invalid schedule day: {schedule_day}")            # Create cron trigger for weekly scheduling
+            # Create cron trigger for weekly scheduling
             trigger = CronTrigger(
-                day_of_week=weekday,
+                day_of_week=self.weekday,
                 hour=hour,
                 minute=minute
             )
@@ -62,36 +104,126 @@ class BackupScheduler:
                 replace_existing=True
             )
 
-            self.logger.info(f"Scheduler configured for {schedule_day}s at {schedule_time}")
-            self.logger.info("Starting backup scheduler...")
+            # Don't hold device sessions open for the week between backups
+            if self.device_manager is not None:
+                self.scheduler.add_job(
+                    func=self.device_manager.close_idle_connections,
+                    trigger='interval',
+                    minutes=1,
+                    id='close_idle_sessions',
+                    name='Close Idle Device Sessions',
+                    replace_existing=True
+                )
+
+                # Open sessions just before the backup so its window skips
+                # the handshakes; wrap around the start of the week
+                week_minute = (self.weekday * 1440 + hour * 60 + minute - PREWARM_LEAD_MINUTES) % (7 * 1440)
+                prewarm_day, day_minute = divmod(week_minute, 1440)
+                self.scheduler.add_job(
+                    func=self._prewarm,
+                    trigger=CronTrigger(
+                        day_of_week=prewarm_day,
+                        hour=day_minute // 60,
+                        minute=day_minute % 60
+                    ),
+                    id='prewarm_sessions',
+                    name='Pre-open Device Sessions',
+                    replace_existing=True
+                )
+
+            logger.info("Scheduler configured for %ss at %s", schedule_day, schedule_time)
+            logger.info("Starting backup scheduler...")
+
+            self.scheduler.start()
 
             # Try to log next run time (handle API changes)
             try:
                 job = self.scheduler.get_job('weekly_backup')
                 if hasattr(job, 'next_run_time'):
                     next_run = job.next_run_time
-                    self.logger.info(f"Next backup scheduled for: {next_run}")
+                    logger.info("Next backup scheduled for: %s", next_run)
                 else:
-                    self.logger.info(f"Next backup scheduled for {schedule_day}s at {schedule_time}")
+                    logger.info("Next backup scheduled for %ss at %s", schedule_day, schedule_time)
             except Exception as e:
-                self.logger.warning(f"Could not determine next run time: {e}")
+                logger.warning("Could not determine next run time: %s", e)
 
-            # Start the scheduler (this will block)
-            self.scheduler.start()
+            # Shut down cleanly when a service manager sends SIGTERM
+            try:
+                self.loop.add_signal_handler(signal.SIGTERM, self.stop_scheduler)
+            except (NotImplementedError, RuntimeError):
+                # Unsupported on Windows event loops and outside the main thread
+                pass
+
+            # Run the event loop (this will block)
+            self.loop.run_forever()
+
+            # stop_scheduler stopped the loop; finish running jobs here
+            self._shutdown()
 
         except KeyboardInterrupt:
-            self.logger.info("Scheduler stopped by user")
+            logger.info("Scheduler stopped by user")
             self.stop_scheduler()
         except Exception as e:
-            self.logger.error(f"Error starting scheduler: {str(e)}")
+            logger.error("Error starting scheduler: %s", e)
             raise
 
+    def _prewarm(self):
+        """Open device sessions ahead of the scheduled backup."""
+        try:
+            devices = self.config_manager.load_devices_config()
+        except Exception as e:
+            logger.warning("Skipping session pre-warm: %s", e)
+            return
+
+        # Sharded runs connect from worker processes, which can't use
+        # sessions opened here
+        if (min(self.config_manager.get_worker_processes(), len(devices),
+                self.config_manager.get_max_concurrency()) > 1
+                and not self.config_manager.get_archive_per_run()):
+            return
+
+        opened = self.device_manager.prewarm(devices, self.config_manager.get_max_concurrency())
+        logger.info("Pre-opened %s of %s device sessions", opened, len(devices))
+
     def stop_scheduler(self):
-        """Stop the backup scheduler."""
+        """
+        Stop the backup scheduler.
+
+        No new jobs start, and a backup already running finishes first.
+        While the loop runs, this only stops it; start_scheduler then
+        completes the shutdown before it returns.
+        """
+        if self.scheduler.running:
+            logger.info("Stopping backup scheduler...")
+            self.scheduler.pause()
+
+            if self.loop.is_running():
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            elif not self.loop.is_closed():
+                self._shutdown()
+
+    def _shutdown(self):
+        """Wait for running jobs on the stopped loop, then shut the scheduler down."""
+        # AsyncIOScheduler.shutdown cancels running coroutine jobs whatever
+        # wait says, so let them finish first
+        pending = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+        if pending:
+            logger.info("Waiting for %s running job(s) to finish...", len(pending))
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
         if self.scheduler.running:
-            self.logger.info("Stopping backup scheduler...")
             self.scheduler.shutdown()
-            self.logger.info("Scheduler stopped")
+
+        # Let the shutdown queued on the idle loop complete, and wait for
+        # plain-function jobs running in the loop's default executor
+        self.loop.run_until_complete(asyncio.sleep(0))
+        if hasattr(self.loop, 'shutdown_default_executor'):
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+
+        if self.device_manager is not None:
+            self.device_manager.close_all()
+
+        logger.info("Scheduler stopped")
 
     def get_next_run_time(self) -> str:
         """
@@ -110,12 +242,23 @@ class BackupScheduler:
             return "Unknown"
 
     def run_immediate_backup(self):
-        """Run an immediate backup outside of the schedule."""
-        self.logger.info("Running immediate backup...")
+        """
+        Run an immediate backup outside of the schedule.
+
+        While the scheduler is running, a coroutine backup function is
+        queued onto the scheduler's loop, so it shares the loop with
+        scheduled jobs; call this from another thread in that case.
+        """
+        logger.info("Running immediate backup...")
         try:
-            self.backup_function()
+            result = self.backup_function()
+            if asyncio.iscoroutine(result):
+                if self.loop.is_running():
+                    asyncio.run_coroutine_threadsafe(result, self.loop).result()
+                else:
+                    asyncio.run(result)
         except Exception as e:
-            self.logger.error(f"Error during immediate backup: {str(e)}")
+            logger.error("Error during immediate backup: %s", e)
             raise
 
 
@@ -132,8 +275,8 @@ class SimpleScheduler:
         """
         self.config_manager = config_manager
         self.backup_function = backup_function
-        self.logger = logging.getLogger(__name__)
         self.running = False
+        self._stop_event = threading.Event()
 
     def start_scheduler(self):
         """Start the simple scheduler."""
@@ -143,51 +286,43 @@ class SimpleScheduler:
             # Get schedule configuration
             schedule_day, schedule_time = self.config_manager.get_schedule_info()
 
-            # Schedule the backup job
-            if schedule_day.lower() == 'sunday':
-                schedule.every().sunday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'monday':
-                schedule.every().monday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'tuesday':
-                schedule.every().tuesday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'wednesday':
-                schedule.every().wednesday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'thursday':
-                schedule.every().thursday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'friday':
-                schedule.every().friday.at(schedule_time).do(self.backup_function)
-            elif schedule_day.lower() == 'saturday':
-                schedule.every().saturday.at(schedule_time).do(self.backup_function)
-            else:
-                raise ValueError(f"Invalid schedule day: {schedule_day}")
+            # Schedule the backup job; Job exposes one property per day name
+            day = _parse_schedule_day(schedule_day)
+            getattr(schedule.every(), day).at(schedule_time).do(self.backup_function)
 
-            self.logger.info(f"Simple scheduler configured for {schedule_day}s at {schedule_time}")
-            self.logger.info("Starting simple backup scheduler...")
+            logger.info("Simple scheduler configured for %ss at %s", schedule_day, schedule_time)
+            logger.info("Starting simple backup scheduler...")
 
             self.running = True
+            self._stop_event.clear()
 
-            # Run the scheduler loop
+            # Sleep until the next job is due; stop_scheduler wakes us early
             while self.running:
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    break
+                if idle > 0 and self._stop_event.wait(timeout=min(idle, MAX_IDLE_WAIT_SECONDS)):
+                    break
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
 
         except KeyboardInterrupt:
-            self.logger.info("Simple scheduler stopped by user")
+            logger.info("Simple scheduler stopped by user")
             self.stop_scheduler()
         except Exception as e:
-            self.logger.error(f"Error starting simple scheduler: {str(e)}")
+            logger.error("Error starting simple scheduler: %s", e)
             raise
 
     def stop_scheduler(self):
         """Stop the simple scheduler."""
         self.running = False
-        self.logger.info("Simple scheduler stopped")
+        self._stop_event.set()
+        logger.info("Simple scheduler stopped")
 
     def run_immediate_backup(self):
         """Run an immediate backup outside of the schedule."""
-        self.logger.info("Running immediate backup...")
+        logger.info("Running immediate backup...")
         try:
             self.backup_function()
         except Exception as e:
-            self.logger.error(f"Error during immediate backup: {str(e)}")
+            logger.error("Error during immediate backup: %s", e)
             raise
@@ -14,13 +14,13 @@ REM Check if Python is available
 python --version >nul 2>&1
 if errorlevel 1 (
     echo ERROR: Python is not installed or not in PATH
-    echo Please install Python 3.7+ and try again
+    echo Please install Python 3.8+ and try again
     pause
     exit /b 1
 )
 
 REM Check if required packages are installed
-python -c "import netmiko, yaml, schedule" >nul 2>&1
+python -c "import netmiko, yaml, schedule, zstandard" >nul 2>&1
 if errorlevel 1 (
     echo Installing required packages...
     pip install -r requirements.txt
@@ -7,6 +7,7 @@ Run basic tests to verify the tool is working correctly.
 
 import sys
 import os
+from functools import lru_cache
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.config_manager import ConfigManager
@@ -14,11 +15,21 @@ from src.backup_manager import BackupManager
 from src.email_notifier import EmailNotifier
 import logging
 
+@lru_cache(maxsize=None)
+def get_config_manager():
+    """Get the ConfigManager shared by all tests, so config files are parsed once."""
+    return ConfigManager()
+
+@lru_cache(maxsize=None)
+def get_backup_manager():
+    """Get the BackupManager shared by all tests."""
+    return BackupManager(get_config_manager())
+
 def test_config_loading():
     """Test configuration loading."""
     print("Testing configuration loading...")
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
 
         # Test settings loading
         settings = config_manager.load_settings_config()
@@ -37,8 +48,7 @@ def test_backup_manager():
     """Test backup manager initialization."""
     print("\nTesting backup manager...")
     try:
-        config_manager = ConfigManager()
-        backup_manager = BackupManager(config_manager)
+        backup_manager = get_backup_manager()
 
         # Test backup statistics
         stats = backup_manager.get_backup_statistics()
@@ -54,9 +64,7 @@ def test_email_notifier():
     """Test email notifier."""
     print("\nTesting email notifier...")
     try:
-        config_manager = ConfigManager()
-        settings = config_manager.load_settings_config()
-        email_notifier = EmailNotifier(settings['email'])
+        email_notifier = EmailNotifier(get_config_manager().get_email_config())
 
         print(f"✓ Email notifier initialized")
         print(f"  Email enabled: {email_notifier.enabled}")
@@ -70,8 +78,7 @@ def test_device_connections():
     """Test device connections (if configured)."""
     print("\nTesting device connections...")
     try:
-        config_manager = ConfigManager()
-        backup_manager = BackupManager(config_manager)
+        backup_manager = get_backup_manager()
 
         # Test device connections
         results = backup_manager.test_devices()